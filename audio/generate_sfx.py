@@ -7,25 +7,65 @@ Usage:
     python generate_sfx.py              # Generate all sounds
     python generate_sfx.py --list       # List available sounds
     python generate_sfx.py sword_hit    # Generate specific sound
+    python generate_sfx.py --force      # Regenerate even if unchanged
 """
 
 import numpy as np
-from scipy import signal
-from scipy.ndimage import uniform_filter1d
+import numba as nb
+import numexpr as ne
 import soundfile as sf
 import os
 import argparse
+import functools
+import hashlib
+import inspect
+import math
+import multiprocessing
+import sys
+import types
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 # Audio settings
 SAMPLE_RATE = 44100
+DTYPE = np.float32  # Working precision; output is 16-bit PCM anyway
 OUTPUT_DIR = Path(__file__).parent / "generated"
 
 
+def _time_grid(samples):
+    t = np.arange(samples, dtype=DTYPE) / DTYPE(SAMPLE_RATE)
+    t.setflags(write=False)
+    return t
+
+
+# One read-only sample time grid shared by every generator; shorter
+# durations are views of its prefix, and it grows for longer sounds
+_TMAX = _time_grid(SAMPLE_RATE)
+
+# Random source for all generators (reseeded per sound by the dispatcher),
+# plus reusable noise buffers keyed by length
+_RNG = np.random.default_rng()
+_SCRATCH: dict[int, np.ndarray] = {}
+
+# Background wav writes, so encoding overlaps with the next generator
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+_FUTURES: list[Future] = []
+
+
 def ensure_output_dir():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _t(duration_s):
+    """Return the (read-only) sample time grid for a duration."""
+    global _TMAX
+    samples = int(SAMPLE_RATE * duration_s)
+    if samples > len(_TMAX):
+        _TMAX = _time_grid(samples)
+    return _TMAX[:samples]
+
+
 def normalize(audio, peak=0.9):
     """Normalize audio to peak amplitude."""
     max_val = np.max(np.abs(audio))
@@ -40,51 +80,110 @@ def fade(audio, fade_in_ms=5, fade_out_ms=50):
     fade_out_samples = int(SAMPLE_RATE * fade_out_ms / 1000)
 
     if fade_in_samples > 0 and fade_in_samples < len(audio):
-        audio[:fade_in_samples] *= np.linspace(0, 1, fade_in_samples)
+        audio[:fade_in_samples] *= np.linspace(0, 1, fade_in_samples, dtype=DTYPE)
     if fade_out_samples > 0 and fade_out_samples < len(audio):
-        audio[-fade_out_samples:] *= np.linspace(1, 0, fade_out_samples)
+        audio[-fade_out_samples:] *= np.linspace(1, 0, fade_out_samples, dtype=DTYPE)
 
     return audio
 
 
+def _mix(*layers):
+    """Sum (signal, gain) layers, keeping at most two full-length buffers live."""
+    (first, first_gain), rest = layers[0], layers[1:]
+    out = np.multiply(first, first_gain)
+    scaled = np.empty_like(out)
+    for sig, gain in rest:
+        np.multiply(sig, gain, out=scaled)
+        out += scaled
+    return out
+
+
+def _write_wav(filepath, audio):
+    sf.write(filepath, audio, SAMPLE_RATE)
+    print(f"  Generated: {filepath}")
+
+
 def save_wav(audio, filename):
-    """Save audio to wav file."""
+    """Queue audio to be written to a wav file in the background."""
     ensure_output_dir()
     filepath = OUTPUT_DIR / f"{filename}.wav"
-    sf.write(filepath, audio, SAMPLE_RATE)
-    print(f"  Generated: {filepath}")
+    _FUTURES.append(_IO_POOL.submit(_write_wav, filepath, audio.astype(DTYPE)))
+
+
+def _drain_writes():
+    """Wait for all queued writes, re-raising the first failure."""
+    while _FUTURES:
+        _FUTURES.pop(0).result()
+
+
+def _sig():
+    """Import scipy.signal on first use; it dominates start-up time."""
+    global signal
+    import scipy.signal as signal
+    return signal
+
+
+def _cutoff(hz):
+    """Quantize a cutoff to 5 Hz steps and normalize it to Nyquist."""
+    nyq = SAMPLE_RATE / 2
+    return min(round(hz / 5) * 5 / nyq, 0.99)
+
+
+@functools.lru_cache(maxsize=512)
+def _sos(order, btype, cutoff):
+    """Design a Butterworth filter as second-order sections (cached)."""
+    wn = cutoff[0] if len(cutoff) == 1 else list(cutoff)
+    return _sig().butter(order, wn, btype=btype, output='sos').astype(DTYPE)
 
 
 def lowpass(audio, cutoff_hz, order=4):
     """Apply lowpass filter."""
-    nyq = SAMPLE_RATE / 2
-    normalized_cutoff = min(cutoff_hz / nyq, 0.99)
-    b, a = signal.butter(order, normalized_cutoff, btype='low')
-    return signal.filtfilt(b, a, audio)
+    sos = _sos(order, 'low', (_cutoff(cutoff_hz),))
+    return _sig().sosfiltfilt(sos, audio, padtype=None)
 
 
 def highpass(audio, cutoff_hz, order=4):
     """Apply highpass filter."""
-    nyq = SAMPLE_RATE / 2
-    normalized_cutoff = min(cutoff_hz / nyq, 0.99)
-    b, a = signal.butter(order, normalized_cutoff, btype='high')
-    return signal.filtfilt(b, a, audio)
+    sos = _sos(order, 'high', (_cutoff(cutoff_hz),))
+    return _sig().sosfiltfilt(sos, audio, padtype=None)
 
 
-def bandpass(audio, low_hz, high_hz, order=4):
-    """Apply bandpass filter."""
-    nyq = SAMPLE_RATE / 2
-    low = min(low_hz / nyq, 0.99)
-    high = min(high_hz / nyq, 0.99)
+def _band_sos(low_hz, high_hz, order):
+    """Cached bandpass design for a pair of cutoffs in Hz."""
+    low = _cutoff(low_hz)
+    high = _cutoff(high_hz)
     if low >= high:
         low = high * 0.5
-    b, a = signal.butter(order, [low, high], btype='band')
-    return signal.filtfilt(b, a, audio)
+    return _sos(order, 'band', (low, high))
+
+
+def bandpass(audio, low_hz, high_hz, order=4):
+    """Apply bandpass filter."""
+    return _sig().sosfiltfilt(_band_sos(low_hz, high_hz, order), audio, padtype=None)
+
+
+# Single-pass (causal) variants, for noise that is immediately shaped by a
+# fast-decaying envelope where zero phase makes no audible difference
+
+def lowpass_causal(audio, cutoff_hz, order=4):
+    """Apply single-pass lowpass filter."""
+    return _sig().sosfilt(_sos(order, 'low', (_cutoff(cutoff_hz),)), audio)
+
+
+def highpass_causal(audio, cutoff_hz, order=4):
+    """Apply single-pass highpass filter."""
+    return _sig().sosfilt(_sos(order, 'high', (_cutoff(cutoff_hz),)), audio)
+
+
+def bandpass_causal(audio, low_hz, high_hz, order=4):
+    """Apply single-pass bandpass filter."""
+    return _sig().sosfilt(_band_sos(low_hz, high_hz, order), audio)
 
 
 def distortion(audio, amount=2.0):
-    """Apply soft clipping distortion."""
-    return np.tanh(audio * amount)
+    """Apply soft clipping distortion (Pade approximation of tanh, clipped at +/-3)."""
+    x = audio * amount
+    return ne.evaluate("where(x > 3, 1, where(x < -3, -1, x * (27 + x * x) / (27 + 9 * x * x)))")
 
 
 def bitcrush(audio, bits=8):
@@ -93,19 +192,25 @@ def bitcrush(audio, bits=8):
     return np.round(audio * levels) / levels
 
 
+@nb.njit(cache=True, fastmath=True)
+def _comb(output, delay_samples, decay):
+    """Feedback comb filter applied in place (compiled)."""
+    for i in range(delay_samples, output.shape[0]):
+        output[i] += output[i - delay_samples] * decay
+
+
 def reverb_simple(audio, decay=0.3, delay_ms=30):
     """Simple comb filter reverb."""
     delay_samples = int(SAMPLE_RATE * delay_ms / 1000)
     output = audio.copy()
-    for i in range(delay_samples, len(audio)):
-        output[i] += output[i - delay_samples] * decay
+    _comb(output, delay_samples, decay)
     return output
 
 
 def pitch_envelope(duration_s, start_hz, end_hz):
     """Generate frequency envelope."""
     samples = int(SAMPLE_RATE * duration_s)
-    return np.linspace(start_hz, end_hz, samples)
+    return np.linspace(start_hz, end_hz, samples, dtype=DTYPE)
 
 
 def amplitude_envelope(duration_s, attack=0.01, decay=0.1, sustain=0.5, release=0.2):
@@ -118,44 +223,128 @@ def amplitude_envelope(duration_s, attack=0.01, decay=0.1, sustain=0.5, release=
     release_samples = samples - attack_samples - decay_samples
 
     env = np.concatenate([
-        np.linspace(0, 1, max(1, attack_samples)),
-        np.linspace(1, sustain, max(1, decay_samples)),
-        np.linspace(sustain, 0, max(1, release_samples))
+        np.linspace(0, 1, max(1, attack_samples), dtype=DTYPE),
+        np.linspace(1, sustain, max(1, decay_samples), dtype=DTYPE),
+        np.linspace(sustain, 0, max(1, release_samples), dtype=DTYPE)
     ])
 
     return env[:samples] if len(env) >= samples else np.pad(env, (0, samples - len(env)))
 
 
+@nb.njit(cache=True, fastmath=True)
+def _pink_kellet(n, seed):
+    """Pink noise via Paul Kellet's refined 1/f filter (compiled)."""
+    np.random.seed(seed)
+    out = np.empty(n, dtype=DTYPE)
+    b0 = b1 = b2 = b3 = b4 = b5 = b6 = 0.0
+    for i in range(n):
+        white = np.random.randn()
+        b0 = 0.99886 * b0 + white * 0.0555179
+        b1 = 0.99332 * b1 + white * 0.0750759
+        b2 = 0.96900 * b2 + white * 0.1538520
+        b3 = 0.86650 * b3 + white * 0.3104856
+        b4 = 0.55000 * b4 + white * 0.5329522
+        b5 = -0.7616 * b5 - white * 0.0168980
+        # Scaled to the level of the FFT recipe so existing mixes keep their balance
+        out[i] = (b0 + b1 + b2 + b3 + b4 + b5 + b6 + white * 0.5362) * 0.0067
+        b6 = white * 0.115926
+    return out
+
+
+@functools.lru_cache(maxsize=32)
+def _pink_filter(samples):
+    """1/sqrt(f) spectral shaping for FFT pink noise of a given length (cached)."""
+    freqs = np.fft.rfftfreq(samples, 1/SAMPLE_RATE)
+    freqs[0] = 1  # Avoid division by zero
+    pink_filter = (1 / np.sqrt(freqs)).astype(DTYPE)
+    pink_filter.setflags(write=False)
+    return pink_filter
+
+
 def noise(duration_s, color='white'):
     """Generate noise."""
     samples = int(SAMPLE_RATE * duration_s)
-    white = np.random.randn(samples)
-
-    if color == 'white':
-        return white
-    elif color == 'pink':
-        # Pink noise: -3dB per octave
-        freqs = np.fft.rfftfreq(samples, 1/SAMPLE_RATE)
-        freqs[0] = 1  # Avoid division by zero
-        pink_filter = 1 / np.sqrt(freqs)
-        spectrum = np.fft.rfft(white) * pink_filter
-        return np.fft.irfft(spectrum, samples)
-    elif color == 'brown':
+
+    if color == 'pink':
+        # Pink noise: -3dB per octave, O(N) IIR approximation
+        return _pink_kellet(samples, _RNG.integers(1 << 31))
+    elif color in ('pink_fft', 'brown'):
+        # Both shape the draw into a new array, so it can live in a scratch buffer
+        white = _SCRATCH.get(samples)
+        if white is None:
+            white = _SCRATCH[samples] = np.empty(samples, dtype=DTYPE)
+        _RNG.standard_normal(dtype=DTYPE, out=white)
+
+        if color == 'pink_fft':
+            # Pink noise: -3dB per octave, exact spectral shaping
+            from scipy import fft
+            spectrum = fft.rfft(white, workers=-1)
+            spectrum *= _pink_filter(samples)
+            return fft.irfft(spectrum, samples, workers=-1)
         # Brown noise: -6dB per octave (integrated white noise)
         return np.cumsum(white) / 100
 
-    return white
+    return _RNG.standard_normal(samples, dtype=DTYPE)
+
+
+@nb.njit(cache=True)
+def _scatter_add(dst, starts, pops, lens):
+    """Add the first lens[k] samples of each pops row into dst at starts[k] (compiled)."""
+    for k in range(starts.shape[0]):
+        start = starts[k]
+        for i in range(lens[k]):
+            dst[start + i] += pops[k, i]
+
+
+def _add_pops(dst, count, len_range_s, cutoff_hz, decay, gain_range):
+    """Scatter highpassed, exponentially decaying noise pops into dst in one batch."""
+    n = len(dst)
+    starts = _RNG.integers(0, n, count)
+    lens = _RNG.integers(int(len_range_s[0] * SAMPLE_RATE), int(len_range_s[1] * SAMPLE_RATE), count)
+    pop_len = lens.max()
+
+    # Filter all pops at once; each row decays over its own length
+    pops = highpass_causal(_RNG.standard_normal((count, pop_len), dtype=DTYPE), cutoff_hz)
+    pop_t = np.arange(pop_len, dtype=DTYPE) / np.maximum(lens - 1, 1).astype(DTYPE)[:, None]
+    pops *= np.exp(-pop_t * decay)
+    pops *= _RNG.uniform(*gain_range, (count, 1))
+
+    keep = starts + lens < n  # Drop pops that would run past the end
+    _scatter_add(dst, starts[keep], pops[keep], lens[keep])
 
 
 def sine_wave(freq_hz, duration_s, phase=0):
-    """Generate sine wave."""
-    t = np.linspace(0, duration_s, int(SAMPLE_RATE * duration_s), endpoint=False)
-    return np.sin(2 * np.pi * freq_hz * t + phase)
+    """Generate sine wave; the phase is float64 so long, high tones keep full precision."""
+    samples = int(SAMPLE_RATE * duration_s)
+    phase = np.arange(samples) * (2 * np.pi * freq_hz / SAMPLE_RATE) + phase
+    return np.sin(phase).astype(DTYPE)
+
+
+def _damped_sine(t, freq_hz, decay):
+    """Exponentially decaying sine, fused into a single pass."""
+    return ne.evaluate("sin(w * t) * exp(-k * t)",
+                       local_dict={'t': t, 'w': DTYPE(2 * np.pi * freq_hz), 'k': DTYPE(decay)})
+
+
+def _damped_sines(t, partials):
+    """Sum of decaying sines given as (freq_hz, decay, amp), fused into a single pass."""
+    terms = []
+    local_dict = {'t': t}
+    for i, (freq_hz, decay, amp) in enumerate(partials):
+        terms.append(f"a{i} * sin(w{i} * t) * exp(-k{i} * t)")
+        local_dict.update({f'w{i}': DTYPE(2 * np.pi * freq_hz), f'k{i}': DTYPE(decay),
+                           f'a{i}': DTYPE(amp)})
+    return ne.evaluate(" + ".join(terms), local_dict=local_dict)
+
+
+def _linear_chirp_phase(t, f0, f1, T):
+    """Phase of a sweep from f0 to f1 Hz over T seconds (integrated in closed form)."""
+    return 2 * np.pi * (f0 * t + 0.5 * (f1 - f0) * t * t / T)
 
 
 def fm_synthesis(carrier_hz, mod_hz, mod_index, duration_s):
     """FM synthesis for complex timbres."""
-    t = np.linspace(0, duration_s, int(SAMPLE_RATE * duration_s), endpoint=False)
+    t = _t(duration_s)
     modulator = mod_index * np.sin(2 * np.pi * mod_hz * t)
     return np.sin(2 * np.pi * carrier_hz * t + modulator)
 
@@ -169,17 +358,15 @@ def gen_sword_hit():
     duration = 0.25
 
     # Metallic ring (high frequency sine with fast decay)
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
-    ring = np.sin(2 * np.pi * 1200 * t) * np.exp(-t * 25)
-    ring += np.sin(2 * np.pi * 2400 * t) * np.exp(-t * 35) * 0.5
-    ring += np.sin(2 * np.pi * 800 * t) * np.exp(-t * 20) * 0.3
+    t = _t(duration)
+    ring = _damped_sines(t, [(1200, 25, 1.0), (2400, 35, 0.5), (800, 20, 0.3)])
 
     # Impact thud (noise burst)
     impact = noise(duration, 'brown') * np.exp(-t * 30)
     impact = lowpass(impact, 400)
 
     # Combine
-    audio = ring * 0.4 + impact * 0.6
+    audio = _mix((ring, 0.4), (impact, 0.6))
     audio = fade(normalize(audio), fade_in_ms=1, fade_out_ms=30)
     save_wav(audio, "sword_hit")
 
@@ -187,21 +374,20 @@ def gen_sword_hit():
 def gen_sword_swing():
     """Sword whoosh through air."""
     duration = 0.3
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Filtered noise with pitch sweep
     swoosh = noise(duration, 'pink')
 
-    # Bandpass that sweeps in frequency
-    center_freq = 800 + 1200 * (1 - np.exp(-t * 8))
+    # Apply time-varying filter as a per-frame Gaussian mask in the STFT domain
+    nperseg, noverlap = 512, 384
+    f, frame_t, Z = _sig().stft(swoosh, fs=SAMPLE_RATE, nperseg=nperseg, noverlap=noverlap)
 
-    # Apply time-varying filter by chunking
-    chunk_size = 512
-    filtered = np.zeros_like(swoosh)
-    for i in range(0, len(swoosh) - chunk_size, chunk_size):
-        freq = center_freq[i]
-        chunk = swoosh[i:i+chunk_size]
-        filtered[i:i+chunk_size] = bandpass(chunk, freq * 0.5, freq * 1.5)
+    # Bandpass that sweeps in frequency
+    center = (800 + 1200 * (1 - np.exp(-frame_t * 8)))[None, :]
+    Z *= np.exp(-((f[:, None] - center) / (0.5 * center)) ** 2)
+    _, filtered = _sig().istft(Z, fs=SAMPLE_RATE, nperseg=nperseg, noverlap=noverlap)
+    filtered = filtered[:len(swoosh)]
 
     # Amplitude envelope - builds then fades
     env = np.sin(np.pi * t / duration) ** 0.5
@@ -214,15 +400,11 @@ def gen_sword_swing():
 def gen_parry():
     """Successful parry - sharp metallic clang."""
     duration = 0.4
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Multiple metallic frequencies (inharmonic for bell-like quality)
     freqs = [523, 784, 1046, 1318, 1568]  # C5 and harmonics with slight detuning
-    audio = np.zeros_like(t)
-
-    for i, freq in enumerate(freqs):
-        decay = 8 + i * 2
-        audio += np.sin(2 * np.pi * freq * t) * np.exp(-t * decay) * (1 / (i + 1))
+    audio = _damped_sines(t, [(freq, 8 + i * 2, 1 / (i + 1)) for i, freq in enumerate(freqs)])
 
     # Add click at start
     click = noise(0.01, 'white')
@@ -239,7 +421,7 @@ def gen_parry():
 def gen_player_hurt():
     """Player taking damage - grunt with impact."""
     duration = 0.35
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Low impact thud
     impact = noise(duration, 'brown')
@@ -250,7 +432,7 @@ def gen_player_hurt():
     grunt *= np.exp(-t * 8)
     grunt = lowpass(grunt, 500)
 
-    audio = impact * 0.5 + grunt * 0.5
+    audio = _mix((impact, 0.5), (grunt, 0.5))
     audio = fade(normalize(audio), fade_in_ms=2, fade_out_ms=50)
     save_wav(audio, "player_hurt")
 
@@ -258,7 +440,7 @@ def gen_player_hurt():
 def gen_enemy_hurt():
     """Enemy taking damage."""
     duration = 0.2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Higher pitched grunt
     grunt = fm_synthesis(200, 120, 4, duration)
@@ -269,7 +451,7 @@ def gen_enemy_hurt():
     impact = noise(duration, 'brown')
     impact = lowpass(impact, 300) * np.exp(-t * 25)
 
-    audio = impact * 0.4 + grunt * 0.6
+    audio = _mix((impact, 0.4), (grunt, 0.6))
     audio = fade(normalize(audio), fade_in_ms=1, fade_out_ms=30)
     save_wav(audio, "enemy_hurt")
 
@@ -277,11 +459,11 @@ def gen_enemy_hurt():
 def gen_enemy_death():
     """Enemy dying - extended grunt and thud."""
     duration = 0.6
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Descending grunt
-    freq_env = 180 * np.exp(-t * 3)
-    grunt = np.sin(2 * np.pi * np.cumsum(freq_env) / SAMPLE_RATE)
+    # Frequency 180 * exp(-3t), integrated in closed form
+    grunt = np.sin(2 * np.pi * 180 * (1 - np.exp(-t * 3)) / 3)
     grunt *= np.exp(-t * 4)
     grunt = lowpass(grunt, 600)
 
@@ -290,10 +472,10 @@ def gen_enemy_death():
     fall = np.zeros_like(t)
     fall_noise = noise(0.3, 'brown')
     fall_noise = lowpass(fall_noise, 150)
-    fall_env = np.exp(-np.linspace(0, 1, len(fall_noise)) * 8)
+    fall_env = np.exp(-np.linspace(0, 1, len(fall_noise), dtype=DTYPE) * 8)
     fall[fall_start:fall_start + len(fall_noise)] = fall_noise * fall_env
 
-    audio = grunt * 0.5 + fall * 0.5
+    audio = _mix((grunt, 0.5), (fall, 0.5))
     audio = fade(normalize(audio), fade_in_ms=2, fade_out_ms=100)
     save_wav(audio, "enemy_death")
 
@@ -301,21 +483,19 @@ def gen_enemy_death():
 def gen_critical_hit():
     """Extra powerful hit - emphasized version of sword_hit."""
     duration = 0.35
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Stronger metallic ring
-    ring = np.sin(2 * np.pi * 800 * t) * np.exp(-t * 15)
-    ring += np.sin(2 * np.pi * 1600 * t) * np.exp(-t * 20) * 0.6
-    ring += np.sin(2 * np.pi * 400 * t) * np.exp(-t * 10) * 0.4
+    ring = _damped_sines(t, [(800, 15, 1.0), (1600, 20, 0.6), (400, 10, 0.4)])
 
     # Heavy impact
     impact = noise(duration, 'brown') * np.exp(-t * 20)
     impact = lowpass(impact, 300)
 
     # Add bass boom
-    boom = sine_wave(60, duration) * np.exp(-t * 12)
+    boom = _damped_sine(t, 60, 12)
 
-    audio = ring * 0.3 + impact * 0.4 + boom * 0.3
+    audio = _mix((ring, 0.3), (impact, 0.4), (boom, 0.3))
     audio = distortion(audio, 1.5)
     audio = fade(normalize(audio), fade_in_ms=1, fade_out_ms=60)
     save_wav(audio, "critical_hit")
@@ -328,19 +508,19 @@ def gen_critical_hit():
 def gen_footstep_dirt():
     """Footstep on dirt/grass."""
     duration = 0.15
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Crunchy noise
     step = noise(duration, 'pink')
-    step = bandpass(step, 200, 2000)
+    step = bandpass_causal(step, 200, 2000)
     step *= np.exp(-t * 30)
 
     # Low thud
     thud = noise(duration, 'brown')
-    thud = lowpass(thud, 150)
+    thud = lowpass_causal(thud, 150)
     thud *= np.exp(-t * 40)
 
-    audio = step * 0.6 + thud * 0.4
+    audio = _mix((step, 0.6), (thud, 0.4))
     audio = fade(normalize(audio, 0.7), fade_in_ms=1, fade_out_ms=20)
     save_wav(audio, "footstep_dirt")
 
@@ -348,19 +528,19 @@ def gen_footstep_dirt():
 def gen_footstep_grass():
     """Subtle grass footstep - light rustling sound."""
     duration = 0.12
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Very soft grass rustle - high-passed pink noise
     rustle = noise(duration, 'pink')
-    rustle = bandpass(rustle, 800, 4000)
+    rustle = bandpass_causal(rustle, 800, 4000)
     rustle *= np.exp(-t * 35)
 
     # Subtle low thud - very quiet
     thud = noise(duration, 'brown')
-    thud = lowpass(thud, 100)
+    thud = lowpass_causal(thud, 100)
     thud *= np.exp(-t * 50)
 
-    audio = rustle * 0.7 + thud * 0.3
+    audio = _mix((rustle, 0.7), (thud, 0.3))
     # Keep it subtle - normalize to lower level
     audio = fade(normalize(audio, 0.4), fade_in_ms=2, fade_out_ms=15)
     save_wav(audio, "footstep_grass")
@@ -369,19 +549,19 @@ def gen_footstep_grass():
 def gen_footstep_stone():
     """Footstep on stone/hard surface."""
     duration = 0.12
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Sharp click
     click = noise(duration, 'white')
-    click = highpass(click, 500)
+    click = highpass_causal(click, 500)
     click *= np.exp(-t * 50)
 
     # Some low end
     thud = noise(duration, 'brown')
-    thud = lowpass(thud, 200)
+    thud = lowpass_causal(thud, 200)
     thud *= np.exp(-t * 60)
 
-    audio = click * 0.7 + thud * 0.3
+    audio = _mix((click, 0.7), (thud, 0.3))
     audio = fade(normalize(audio, 0.7), fade_in_ms=0, fade_out_ms=15)
     save_wav(audio, "footstep_stone")
 
@@ -389,18 +569,17 @@ def gen_footstep_stone():
 def gen_footstep_wood():
     """Footstep on wooden floor."""
     duration = 0.12
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Hollow knock
-    knock = sine_wave(180, duration) * np.exp(-t * 40)
-    knock += sine_wave(360, duration) * np.exp(-t * 50) * 0.5
+    knock = _damped_sines(t, [(180, 40, 1.0), (360, 50, 0.5)])
 
     # Creak
     creak = noise(duration, 'pink')
-    creak = bandpass(creak, 400, 1200)
+    creak = bandpass_causal(creak, 400, 1200)
     creak *= np.exp(-t * 35)
 
-    audio = knock * 0.6 + creak * 0.4
+    audio = _mix((knock, 0.6), (creak, 0.4))
     audio = fade(normalize(audio, 0.7), fade_in_ms=0, fade_out_ms=20)
     save_wav(audio, "footstep_wood")
 
@@ -408,11 +587,10 @@ def gen_footstep_wood():
 def gen_jump():
     """Jump sound - upward pitch sweep."""
     duration = 0.2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Rising pitch
-    freq = 200 + 600 * t / duration
-    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
+    phase = _linear_chirp_phase(t, 200, 800, duration)
     tone = np.sin(phase)
 
     # Envelope
@@ -431,19 +609,19 @@ def gen_jump():
 def gen_land():
     """Landing from jump - impact thud."""
     duration = 0.2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Impact
     impact = noise(duration, 'brown')
-    impact = lowpass(impact, 200)
+    impact = lowpass_causal(impact, 200)
     impact *= np.exp(-t * 25)
 
     # Some higher crunch
     crunch = noise(duration, 'pink')
-    crunch = bandpass(crunch, 200, 1000)
+    crunch = bandpass_causal(crunch, 200, 1000)
     crunch *= np.exp(-t * 40)
 
-    audio = impact * 0.7 + crunch * 0.3
+    audio = _mix((impact, 0.7), (crunch, 0.3))
     audio = fade(normalize(audio, 0.8), fade_in_ms=1, fade_out_ms=30)
     save_wav(audio, "land")
 
@@ -451,11 +629,11 @@ def gen_land():
 def gen_dodge():
     """Quick dodge/roll sound."""
     duration = 0.25
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Cloth swoosh
     swoosh = noise(duration, 'pink')
-    swoosh = bandpass(swoosh, 400, 2000)
+    swoosh = bandpass_causal(swoosh, 400, 2000)
 
     # Quick fade in and out
     env = np.sin(np.pi * t / duration)
@@ -469,41 +647,65 @@ def gen_dodge():
 # UI SOUNDS
 # =============================================================================
 
+@nb.njit(cache=True, fastmath=True)
+def _ui_click(n):
+    out = np.empty(n, dtype=DTYPE)
+    for i in range(n):
+        tt = i / SAMPLE_RATE
+        out[i] = (math.sin(2 * math.pi * 800 * tt) * math.exp(-tt * 80)
+                  + 0.3 * math.sin(2 * math.pi * 1200 * tt) * math.exp(-tt * 100))
+    return out
+
+
 def gen_ui_click():
     """UI button click."""
     duration = 0.05
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
 
-    click = sine_wave(800, duration) * np.exp(-t * 80)
-    click += sine_wave(1200, duration) * np.exp(-t * 100) * 0.3
+    click = _ui_click(int(SAMPLE_RATE * duration))
 
     audio = fade(normalize(click, 0.6), fade_in_ms=0, fade_out_ms=10)
     save_wav(audio, "ui_click")
 
 
+@nb.njit(cache=True, fastmath=True)
+def _ui_hover(n):
+    out = np.empty(n, dtype=DTYPE)
+    for i in range(n):
+        tt = i / SAMPLE_RATE
+        out[i] = math.sin(2 * math.pi * 1000 * tt) * math.exp(-tt * 40)
+    return out
+
+
 def gen_ui_hover():
     """UI hover/select sound."""
     duration = 0.08
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
 
-    tone = sine_wave(1000, duration) * np.exp(-t * 40)
+    tone = _ui_hover(int(SAMPLE_RATE * duration))
 
     audio = fade(normalize(tone, 0.4), fade_in_ms=2, fade_out_ms=15)
     save_wav(audio, "ui_hover")
 
 
+@nb.njit(cache=True, fastmath=True)
+def _two_note(half, freq1, freq2, decay):
+    """Two back-to-back notes of half samples each under one decay (compiled)."""
+    out = np.empty(2 * half, dtype=DTYPE)
+    for i in range(2 * half):
+        tt = i / SAMPLE_RATE
+        if i < half:
+            tone = math.sin(2 * math.pi * freq1 * tt)
+        else:
+            tone = math.sin(2 * math.pi * freq2 * (i - half) / SAMPLE_RATE)
+        out[i] = tone * math.exp(-tt * decay)
+    return out
+
+
 def gen_ui_confirm():
     """Positive confirmation sound."""
     duration = 0.15
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
-
-    # Rising two-note
-    note1 = sine_wave(523, duration * 0.5)  # C5
-    note2 = sine_wave(659, duration * 0.5)  # E5
 
-    audio = np.concatenate([note1, note2])
-    t_full = np.linspace(0, duration, len(audio))
-    audio *= np.exp(-t_full * 10)
+    # Rising two-note: C5 then E5
+    audio = _two_note(int(SAMPLE_RATE * duration * 0.5), 523, 659, 10)
 
     audio = fade(normalize(audio, 0.6), fade_in_ms=2, fade_out_ms=20)
     save_wav(audio, "ui_confirm")
@@ -512,15 +714,9 @@ def gen_ui_confirm():
 def gen_ui_cancel():
     """Negative/cancel sound."""
     duration = 0.15
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
 
     # Descending
-    note1 = sine_wave(400, duration * 0.5)
-    note2 = sine_wave(300, duration * 0.5)
-
-    audio = np.concatenate([note1, note2])
-    t_full = np.linspace(0, duration, len(audio))
-    audio *= np.exp(-t_full * 8)
+    audio = _two_note(int(SAMPLE_RATE * duration * 0.5), 400, 300, 8)
 
     audio = fade(normalize(audio, 0.6), fade_in_ms=2, fade_out_ms=20)
     save_wav(audio, "ui_cancel")
@@ -529,7 +725,7 @@ def gen_ui_cancel():
 def gen_ui_error():
     """Error/invalid action sound."""
     duration = 0.2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Buzzy error
     buzz = np.sign(np.sin(2 * np.pi * 150 * t))  # Square wave
@@ -543,11 +739,10 @@ def gen_ui_error():
 def gen_menu_open():
     """Menu opening sound."""
     duration = 0.2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Ascending sweep
-    freq = 300 + 500 * (t / duration)
-    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
+    phase = _linear_chirp_phase(t, 300, 800, duration)
     tone = np.sin(phase)
 
     env = 1 - (t / duration) ** 2
@@ -560,11 +755,10 @@ def gen_menu_open():
 def gen_menu_close():
     """Menu closing sound."""
     duration = 0.15
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Descending sweep
-    freq = 800 - 400 * (t / duration)
-    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
+    phase = _linear_chirp_phase(t, 800, 400, duration)
     tone = np.sin(phase)
 
     env = 1 - (t / duration)
@@ -581,31 +775,36 @@ def gen_menu_close():
 def gen_item_pickup():
     """Picking up item."""
     duration = 0.25
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
-
-    # Shimmery ascending notes
-    freqs = [523, 659, 784]  # C E G
-    audio = np.zeros(int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
-    for i, freq in enumerate(freqs):
-        start = int(i * 0.03 * SAMPLE_RATE)
-        note = sine_wave(freq, duration - i * 0.03)
-        note *= np.exp(-np.linspace(0, 1, len(note)) * 8)
-        audio[start:start + len(note)] += note * 0.5
+    # Shimmery ascending notes, one row per note on a shared time grid
+    freqs = np.array([523, 659, 784], dtype=DTYPE)[:, None]  # C E G
+    starts = np.arange(3, dtype=DTYPE)[:, None] * 0.03
+    note_t = t - starts
+    notes = np.sin(2 * np.pi * freqs * note_t) * np.exp(-note_t / (duration - starts) * 8)
+    audio = np.where(note_t >= 0, notes, 0).sum(axis=0) * 0.5
 
     audio = fade(normalize(audio, 0.7), fade_in_ms=2, fade_out_ms=40)
     save_wav(audio, "item_pickup")
 
 
+@nb.njit(cache=True, fastmath=True)
+def _coin_pickup(n):
+    out = np.empty(n, dtype=DTYPE)
+    for i in range(n):
+        tt = i / SAMPLE_RATE
+        out[i] = (math.sin(2 * math.pi * 2000 * tt) * math.exp(-tt * 20)
+                  + 0.5 * math.sin(2 * math.pi * 3000 * tt) * math.exp(-tt * 25)
+                  + 0.3 * math.sin(2 * math.pi * 1500 * tt) * math.exp(-tt * 15))
+    return out
+
+
 def gen_coin_pickup():
     """Coin/gold pickup."""
     duration = 0.2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
 
     # High metallic ping
-    ping = sine_wave(2000, duration) * np.exp(-t * 20)
-    ping += sine_wave(3000, duration) * np.exp(-t * 25) * 0.5
-    ping += sine_wave(1500, duration) * np.exp(-t * 15) * 0.3
+    ping = _coin_pickup(int(SAMPLE_RATE * duration))
 
     audio = fade(normalize(ping, 0.6), fade_in_ms=0, fade_out_ms=30)
     save_wav(audio, "coin_pickup")
@@ -614,21 +813,17 @@ def gen_coin_pickup():
 def gen_health_pickup():
     """Health restore sound."""
     duration = 0.4
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
-    # Warm ascending arpeggio
-    notes = []
+    # Warm ascending arpeggio, padded with silence to duration
     note_dur = 0.1
+    note_len = int(SAMPLE_RATE * note_dur)
+    note_env = np.exp(-np.linspace(0, 1, note_len, dtype=DTYPE) * 5)
+    audio = np.zeros(max(len(t), 4 * note_len), dtype=DTYPE)
     for i, freq in enumerate([261, 329, 392, 523]):  # C E G C
-        note = sine_wave(freq, note_dur)
-        note *= np.exp(-np.linspace(0, 1, len(note)) * 5)
-        notes.append(note)
-
-    audio = np.concatenate(notes)
-
-    # Pad to duration
-    if len(audio) < int(SAMPLE_RATE * duration):
-        audio = np.pad(audio, (0, int(SAMPLE_RATE * duration) - len(audio)))
+        note = audio[i * note_len:(i + 1) * note_len]
+        note[:] = sine_wave(freq, note_dur)
+        note *= note_env
 
     audio = fade(normalize(audio, 0.6), fade_in_ms=5, fade_out_ms=60)
     save_wav(audio, "health_pickup")
@@ -637,15 +832,14 @@ def gen_health_pickup():
 def gen_powerup():
     """Power-up acquired."""
     duration = 0.5
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
-    # Rising sweep with harmonics
-    freq = 200 + 800 * (t / duration) ** 2
-    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
+    # Rising sweep with harmonics: frequency 200 + 800 * (t / duration)^2, integrated
+    phase = 2 * np.pi * (200 * t + 800 * t ** 3 / (3 * duration ** 2))
 
-    audio = np.sin(phase)
-    audio += np.sin(phase * 2) * 0.3  # Octave
-    audio += np.sin(phase * 3) * 0.15  # Fifth
+    harmonics = np.arange(1, 4, dtype=DTYPE)[:, None]  # Fundamental, octave, fifth
+    amps = np.array([1.0, 0.3, 0.15], dtype=DTYPE)[:, None]
+    audio = (np.sin(phase * harmonics) * amps).sum(axis=0)
 
     env = np.sin(np.pi * t / duration) ** 0.3
     audio *= env
@@ -661,7 +855,7 @@ def gen_powerup():
 def gen_door_open():
     """Door opening creak."""
     duration = 0.5
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Creaking modulated noise
     mod = np.sin(2 * np.pi * 3 * t) * 0.5 + 0.5
@@ -674,9 +868,10 @@ def gen_door_open():
     rumble = lowpass(rumble, 150)
 
     env = np.ones_like(t)
-    env[-int(0.1 * SAMPLE_RATE):] = np.linspace(1, 0, int(0.1 * SAMPLE_RATE))
+    env[-int(0.1 * SAMPLE_RATE):] = np.linspace(1, 0, int(0.1 * SAMPLE_RATE), dtype=DTYPE)
 
-    audio = (creak * 0.6 + rumble * 0.4) * env
+    audio = _mix((creak, 0.6), (rumble, 0.4))
+    audio *= env
     audio = fade(normalize(audio, 0.7), fade_in_ms=20, fade_out_ms=80)
     save_wav(audio, "door_open")
 
@@ -684,7 +879,7 @@ def gen_door_open():
 def gen_door_close():
     """Door closing thud."""
     duration = 0.3
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Thud
     thud = noise(duration, 'brown')
@@ -694,9 +889,9 @@ def gen_door_close():
     # Latch click
     click = noise(0.05, 'white')
     click = highpass(click, 1000)
-    click *= np.exp(-np.linspace(0, 1, len(click)) * 50)
+    click *= np.exp(-np.linspace(0, 1, len(click), dtype=DTYPE) * 50)
 
-    audio = thud.copy()
+    audio = thud
     click_start = int(0.05 * SAMPLE_RATE)
     audio[click_start:click_start + len(click)] += click * 0.5
 
@@ -707,11 +902,11 @@ def gen_door_close():
 def gen_chest_open():
     """Treasure chest opening."""
     duration = 0.6
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Creaky hinge
-    creak_freq = 400 + 200 * np.sin(2 * np.pi * 2 * t)
-    creak = np.sin(2 * np.pi * np.cumsum(creak_freq) / SAMPLE_RATE)
+    # Frequency 400 + 200 * sin(2 * pi * 2t), integrated in closed form
+    creak = np.sin(2 * np.pi * 400 * t + 100 * (1 - np.cos(2 * np.pi * 2 * t)))
     creak *= bandpass(noise(duration, 'pink'), 300, 2000)
 
     env = np.sin(np.pi * t / duration) ** 0.5
@@ -719,14 +914,12 @@ def gen_chest_open():
 
     # Magical shimmer at the end
     shimmer_start = int(0.3 * SAMPLE_RATE)
-    shimmer = np.zeros_like(t)
     shimmer_len = len(t) - shimmer_start
-    shimmer_t = np.linspace(0, duration * 0.7, shimmer_len)
+    shimmer_t = np.linspace(0, duration * 0.7, shimmer_len, dtype=DTYPE)
 
-    for freq in [1000, 1500, 2000, 2500]:
-        shimmer[shimmer_start:] += np.sin(2 * np.pi * freq * shimmer_t) * np.exp(-shimmer_t * 4) * 0.2
-
-    audio = creak + shimmer
+    partials = [(freq, 4, 0.2) for freq in [1000, 1500, 2000, 2500]]
+    audio = creak
+    audio[shimmer_start:] += _damped_sines(shimmer_t, partials)
     audio = fade(normalize(audio, 0.7), fade_in_ms=10, fade_out_ms=100)
     save_wav(audio, "chest_open")
 
@@ -734,19 +927,19 @@ def gen_chest_open():
 def gen_water_splash():
     """Water splash."""
     duration = 0.4
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     splash = noise(duration, 'white')
-    splash = bandpass(splash, 200, 4000)
+    splash = bandpass_causal(splash, 200, 4000)
     splash *= np.exp(-t * 10)
 
     # Bubbles
     for i in range(5):
-        bubble_start = int(np.random.uniform(0.05, 0.2) * SAMPLE_RATE)
-        bubble_dur = np.random.uniform(0.05, 0.1)
-        bubble_freq = np.random.uniform(300, 600)
+        bubble_start = int(_RNG.uniform(0.05, 0.2) * SAMPLE_RATE)
+        bubble_dur = _RNG.uniform(0.05, 0.1)
+        bubble_freq = _RNG.uniform(300, 600)
         bubble = sine_wave(bubble_freq, bubble_dur)
-        bubble *= np.exp(-np.linspace(0, 1, len(bubble)) * 20)
+        bubble *= np.exp(-np.linspace(0, 1, len(bubble), dtype=DTYPE) * 20)
 
         if bubble_start + len(bubble) < len(splash):
             splash[bubble_start:bubble_start + len(bubble)] += bubble * 0.2
@@ -758,27 +951,20 @@ def gen_water_splash():
 def gen_fire_crackle():
     """Fire crackling loop segment."""
     duration = 1.0
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Base crackle
     crackle = noise(duration, 'brown')
     crackle = bandpass(crackle, 100, 2000)
 
     # Random pops
-    for _ in range(15):
-        pop_pos = int(np.random.uniform(0, duration) * SAMPLE_RATE)
-        pop_len = int(np.random.uniform(0.01, 0.05) * SAMPLE_RATE)
-        if pop_pos + pop_len < len(crackle):
-            pop = np.random.randn(pop_len)  # Generate exact number of samples
-            pop = highpass(pop, 500)
-            pop *= np.exp(-np.linspace(0, 1, pop_len) * 30)
-            crackle[pop_pos:pop_pos + pop_len] += pop * np.random.uniform(0.5, 1.5)
+    _add_pops(crackle, 15, (0.01, 0.05), 500, 30, (0.5, 1.5))
 
     # Low rumble
     rumble = noise(duration, 'brown')
     rumble = lowpass(rumble, 100)
 
-    audio = crackle * 0.7 + rumble * 0.3
+    audio = _mix((crackle, 0.7), (rumble, 0.3))
     audio = fade(normalize(audio, 0.6), fade_in_ms=50, fade_out_ms=50)
     save_wav(audio, "fire_crackle")
 
@@ -786,7 +972,7 @@ def gen_fire_crackle():
 def gen_fire_burn_loop():
     """Longer fire burning loop - intense flames with roar and crackle."""
     duration = 3.0  # 3 seconds for better looping
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Base fire roar - low frequency rumble
     roar = noise(duration, 'brown')
@@ -808,17 +994,10 @@ def gen_fire_burn_loop():
     crackle *= 0.3
 
     # Random pops and snaps throughout
-    for _ in range(40):
-        pop_pos = int(np.random.uniform(0, duration) * SAMPLE_RATE)
-        pop_len = int(np.random.uniform(0.01, 0.08) * SAMPLE_RATE)
-        if pop_pos + pop_len < len(crackle):
-            pop = np.random.randn(pop_len)
-            pop = highpass(pop, 800)
-            pop *= np.exp(-np.linspace(0, 1, pop_len) * 25)
-            crackle[pop_pos:pop_pos + pop_len] += pop * np.random.uniform(0.3, 1.0)
+    _add_pops(crackle, 40, (0.01, 0.08), 800, 25, (0.3, 1.0))
 
     # Combine all layers
-    audio = roar * 0.4 + flames * 0.4 + crackle * 0.2
+    audio = _mix((roar, 0.4), (flames, 0.4), (crackle, 0.2))
 
     # Crossfade for seamless loop
     audio = fade(normalize(audio, 0.7), fade_in_ms=100, fade_out_ms=100)
@@ -828,7 +1007,7 @@ def gen_fire_burn_loop():
 def gen_wind_ambient():
     """Ambient wind loop - gentle outdoor atmosphere."""
     duration = 4.0  # Longer for seamless looping
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Base wind - filtered brown noise
     wind = noise(duration, 'brown')
@@ -853,7 +1032,7 @@ def gen_wind_ambient():
     whistle = bandpass(whistle, 1500, 3500)
     whistle *= 0.05 * (0.5 * np.sin(2 * np.pi * 0.12 * t + 0.5) + 0.5)
 
-    audio = wind * 0.7 + gusts * 0.25 + whistle * 0.05
+    audio = _mix((wind, 0.7), (gusts, 0.25), (whistle, 0.05))
 
     # Long crossfade for seamless loop
     audio = fade(normalize(audio, 0.35), fade_in_ms=200, fade_out_ms=200)
@@ -863,7 +1042,7 @@ def gen_wind_ambient():
 def gen_wind_gust():
     """Short wind gust sound effect."""
     duration = 1.5
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Wind whoosh
     gust = noise(duration, 'pink')
@@ -880,7 +1059,7 @@ def gen_wind_gust():
 def gen_fireball_flight():
     """Fireball in flight - whooshing fiery wind with crackling."""
     duration = 1.5  # Loopable duration
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Base wind whoosh - constant rushing air
     wind = noise(duration, 'pink')
@@ -901,14 +1080,7 @@ def gen_fireball_flight():
     crackle *= 0.3
 
     # Random pops/sparks
-    for _ in range(20):
-        pop_pos = int(np.random.uniform(0, duration) * SAMPLE_RATE)
-        pop_len = int(np.random.uniform(0.01, 0.04) * SAMPLE_RATE)
-        if pop_pos + pop_len < len(crackle):
-            pop = np.random.randn(pop_len)
-            pop = highpass(pop, 1000)
-            pop *= np.exp(-np.linspace(0, 1, pop_len) * 35)
-            crackle[pop_pos:pop_pos + pop_len] += pop * np.random.uniform(0.3, 0.8)
+    _add_pops(crackle, 20, (0.01, 0.04), 1000, 35, (0.3, 0.8))
 
     # Subtle high whistle for speed
     whistle = noise(duration, 'white')
@@ -916,7 +1088,7 @@ def gen_fireball_flight():
     whistle *= 0.15
 
     # Combine layers - emphasize wind and fire equally
-    audio = wind * 0.35 + roar * 0.30 + crackle * 0.20 + whistle * 0.15
+    audio = _mix((wind, 0.35), (roar, 0.30), (crackle, 0.20), (whistle, 0.15))
 
     # Crossfade for seamless loop
     audio = fade(normalize(audio, 0.7), fade_in_ms=80, fade_out_ms=80)
@@ -926,7 +1098,7 @@ def gen_fireball_flight():
 def gen_fire_cast():
     """Fire wand cast sound - breathy FFFF fire burst."""
     duration = 0.3
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Main fire burst - breathy high-frequency noise (the "FFFF" sound)
     fire_noise = noise(duration, 'white')
@@ -949,7 +1121,7 @@ def gen_fire_cast():
     rumble *= np.exp(-t * 20)  # Faster decay for punch
 
     # Combine - emphasize the high breathy noise
-    audio = fire_noise * 0.5 + mid_fire * 0.3 + rumble * 0.2
+    audio = _mix((fire_noise, 0.5), (mid_fire, 0.3), (rumble, 0.2))
 
     audio = fade(normalize(audio, 1.0), fade_in_ms=2, fade_out_ms=30)
     save_wav(audio, "fire_cast")
@@ -958,7 +1130,7 @@ def gen_fire_cast():
 def gen_punch_hit():
     """Meaty fist punch/hit sound - solid thump with flesh impact."""
     duration = 0.25
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Deep thump - the core of the punch
     thump = noise(duration, 'brown')
@@ -966,8 +1138,7 @@ def gen_punch_hit():
     thump *= np.exp(-t * 25)
 
     # Low frequency punch "boom"
-    boom = sine_wave(60, duration) * np.exp(-t * 20)
-    boom += sine_wave(40, duration) * np.exp(-t * 15) * 0.5
+    boom = _damped_sines(t, [(60, 20, 1.0), (40, 15, 0.5)])
 
     # Flesh slap - higher mid frequencies
     slap = noise(duration, 'pink')
@@ -977,11 +1148,10 @@ def gen_punch_hit():
     # Quick attack transient
     click = noise(0.02, 'white')
     click = bandpass(click, 500, 2000)
-    click *= np.exp(-np.linspace(0, 1, len(click)) * 80)
+    click *= np.exp(-np.linspace(0, 1, len(click), dtype=DTYPE) * 80)
 
-    audio = np.zeros(int(SAMPLE_RATE * duration))
+    audio = _mix((thump, 0.35), (boom, 0.35), (slap, 0.25))
     audio[:len(click)] += click * 0.4
-    audio += thump * 0.35 + boom * 0.35 + slap * 0.25
 
     # Slight compression/distortion for punch
     audio = distortion(audio, 1.3)
@@ -993,7 +1163,7 @@ def gen_punch_hit():
 def gen_punch_swing():
     """Fast whoosh sound for throwing a punch - quick air displacement."""
     duration = 0.15
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Fast whoosh - short burst of filtered noise
     whoosh = noise(duration, 'pink')
@@ -1008,7 +1178,7 @@ def gen_punch_swing():
     # Add slight pitch sweep (air rushing past)
     sweep = np.sin(2 * np.pi * (300 + t * 1000) * t) * np.exp(-t * 40)
 
-    audio = whoosh * 0.7 + sweep * 0.3
+    audio = _mix((whoosh, 0.7), (sweep, 0.3))
 
     audio = fade(normalize(audio, 0.8), fade_in_ms=1, fade_out_ms=20)
     save_wav(audio, "punch_swing")
@@ -1017,19 +1187,17 @@ def gen_punch_swing():
 def gen_block():
     """Shield/weapon blocking sound."""
     duration = 0.2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Metallic clang
-    clang = np.sin(2 * np.pi * 400 * t) * np.exp(-t * 20)
-    clang += np.sin(2 * np.pi * 650 * t) * np.exp(-t * 25) * 0.6
-    clang += np.sin(2 * np.pi * 200 * t) * np.exp(-t * 15) * 0.4
+    clang = _damped_sines(t, [(400, 20, 1.0), (650, 25, 0.6), (200, 15, 0.4)])
 
     # Impact thud
     thud = noise(duration, 'brown')
     thud = lowpass(thud, 250)
     thud *= np.exp(-t * 30)
 
-    audio = clang * 0.5 + thud * 0.5
+    audio = _mix((clang, 0.5), (thud, 0.5))
     audio = fade(normalize(audio, 0.7), fade_in_ms=1, fade_out_ms=30)
     save_wav(audio, "block")
 
@@ -1037,7 +1205,7 @@ def gen_block():
 def gen_tree_chop():
     """Axe hitting tree - wood chopping sound."""
     duration = 0.3
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Wood crack/thunk
     crack = noise(duration, 'pink')
@@ -1045,17 +1213,15 @@ def gen_tree_chop():
     crack *= np.exp(-t * 25)
 
     # Hollow wood resonance
-    resonance = sine_wave(150, duration) * np.exp(-t * 15)
-    resonance += sine_wave(280, duration) * np.exp(-t * 20) * 0.5
+    resonance = _damped_sines(t, [(150, 15, 1.0), (280, 20, 0.5)])
 
     # Sharp initial impact
     impact = noise(0.03, 'white')
     impact = highpass(impact, 800)
-    impact *= np.exp(-np.linspace(0, 1, len(impact)) * 60)
+    impact *= np.exp(-np.linspace(0, 1, len(impact), dtype=DTYPE) * 60)
 
-    audio = np.zeros(int(SAMPLE_RATE * duration))
+    audio = _mix((crack, 0.4), (resonance, 0.3))
     audio[:len(impact)] += impact * 0.5
-    audio += crack * 0.4 + resonance * 0.3
 
     audio = fade(normalize(audio, 0.8), fade_in_ms=1, fade_out_ms=40)
     save_wav(audio, "tree_chop")
@@ -1064,7 +1230,7 @@ def gen_tree_chop():
 def gen_rock_break():
     """Pickaxe hitting rock/stone."""
     duration = 0.25
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Sharp stone crack
     crack = noise(duration, 'white')
@@ -1072,15 +1238,14 @@ def gen_rock_break():
     crack *= np.exp(-t * 35)
 
     # Metallic ring from pickaxe
-    ring = np.sin(2 * np.pi * 1500 * t) * np.exp(-t * 30)
-    ring += np.sin(2 * np.pi * 2200 * t) * np.exp(-t * 40) * 0.4
+    ring = _damped_sines(t, [(1500, 30, 1.0), (2200, 40, 0.4)])
 
     # Low impact
     thud = noise(duration, 'brown')
     thud = lowpass(thud, 200)
     thud *= np.exp(-t * 40)
 
-    audio = crack * 0.4 + ring * 0.3 + thud * 0.3
+    audio = _mix((crack, 0.4), (ring, 0.3), (thud, 0.3))
     audio = fade(normalize(audio, 0.8), fade_in_ms=0, fade_out_ms=30)
     save_wav(audio, "rock_break")
 
@@ -1088,7 +1253,7 @@ def gen_rock_break():
 def gen_place_block():
     """Placing a block/building material."""
     duration = 0.15
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Soft thump
     thump = noise(duration, 'brown')
@@ -1100,7 +1265,7 @@ def gen_place_block():
     settle = bandpass(settle, 200, 1500)
     settle *= np.exp(-t * 35)
 
-    audio = thump * 0.6 + settle * 0.4
+    audio = _mix((thump, 0.6), (settle, 0.4))
     audio = fade(normalize(audio, 0.6), fade_in_ms=2, fade_out_ms=20)
     save_wav(audio, "place_block")
 
@@ -1108,7 +1273,7 @@ def gen_place_block():
 def gen_dig_dirt():
     """Digging/removing dirt block."""
     duration = 0.2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Crunchy digging
     dig = noise(duration, 'pink')
@@ -1120,7 +1285,7 @@ def gen_dig_dirt():
     thud = lowpass(thud, 150)
     thud *= np.exp(-t * 25)
 
-    audio = dig * 0.6 + thud * 0.4
+    audio = _mix((dig, 0.6), (thud, 0.4))
     audio = fade(normalize(audio, 0.7), fade_in_ms=2, fade_out_ms=25)
     save_wav(audio, "dig_dirt")
 
@@ -1128,7 +1293,7 @@ def gen_dig_dirt():
 def gen_splash_small():
     """Small splash - stepping in water or small object."""
     duration = 0.3
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     splash = noise(duration, 'white')
     splash = bandpass(splash, 300, 3000)
@@ -1136,11 +1301,11 @@ def gen_splash_small():
 
     # A few small bubbles
     for i in range(3):
-        bubble_start = int(np.random.uniform(0.05, 0.15) * SAMPLE_RATE)
-        bubble_dur = np.random.uniform(0.03, 0.06)
-        bubble_freq = np.random.uniform(400, 700)
+        bubble_start = int(_RNG.uniform(0.05, 0.15) * SAMPLE_RATE)
+        bubble_dur = _RNG.uniform(0.03, 0.06)
+        bubble_freq = _RNG.uniform(400, 700)
         bubble = sine_wave(bubble_freq, bubble_dur)
-        bubble *= np.exp(-np.linspace(0, 1, len(bubble)) * 25)
+        bubble *= np.exp(-np.linspace(0, 1, len(bubble), dtype=DTYPE) * 25)
 
         if bubble_start + len(bubble) < len(splash):
             splash[bubble_start:bubble_start + len(bubble)] += bubble * 0.15
@@ -1152,7 +1317,7 @@ def gen_splash_small():
 def gen_eat():
     """Eating/consuming food sound."""
     duration = 0.35
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Crunchy chewing
     crunch = noise(duration, 'pink')
@@ -1167,7 +1332,7 @@ def gen_eat():
     mouth = bandpass(mouth, 100, 800)
     mouth *= 0.3 * chew_pattern
 
-    audio = crunch * 0.7 + mouth * 0.3
+    audio = _mix((crunch, 0.7), (mouth, 0.3))
     audio = fade(normalize(audio, 0.5), fade_in_ms=10, fade_out_ms=40)
     save_wav(audio, "eat")
 
@@ -1175,7 +1340,7 @@ def gen_eat():
 def gen_equip():
     """Equipping weapon/item sound."""
     duration = 0.25
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Metallic scrape/slide
     scrape = noise(duration, 'pink')
@@ -1186,9 +1351,9 @@ def gen_equip():
     click_start = int(0.15 * SAMPLE_RATE)
     click = noise(0.05, 'white')
     click = highpass(click, 1000)
-    click *= np.exp(-np.linspace(0, 1, len(click)) * 50)
+    click *= np.exp(-np.linspace(0, 1, len(click), dtype=DTYPE) * 50)
 
-    audio = scrape.copy()
+    audio = scrape
     if click_start + len(click) < len(audio):
         audio[click_start:click_start + len(click)] += click * 0.6
 
@@ -1199,7 +1364,7 @@ def gen_equip():
 def gen_unequip():
     """Unequipping/dropping item sound."""
     duration = 0.2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Quick metallic slide down
     slide = noise(duration, 'pink')
@@ -1209,9 +1374,9 @@ def gen_unequip():
     # Soft thud
     thud = noise(0.1, 'brown')
     thud = lowpass(thud, 200)
-    thud *= np.exp(-np.linspace(0, 1, len(thud)) * 25)
+    thud *= np.exp(-np.linspace(0, 1, len(thud), dtype=DTYPE) * 25)
 
-    audio = slide.copy()
+    audio = slide
     thud_start = int(0.08 * SAMPLE_RATE)
     if thud_start + len(thud) < len(audio):
         audio[thud_start:thud_start + len(thud)] += thud * 0.4
@@ -1223,25 +1388,26 @@ def gen_unequip():
 def gen_birds_ambient():
     """Ambient bird chirping - outdoor atmosphere."""
     duration = 5.0  # Longer for variety
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
-    audio = np.zeros(int(SAMPLE_RATE * duration))
+    audio = np.zeros(int(SAMPLE_RATE * duration), dtype=DTYPE)
 
     # Generate several random bird chirps
     for _ in range(8):
-        chirp_start = int(np.random.uniform(0.2, duration - 0.5) * SAMPLE_RATE)
-        chirp_dur = np.random.uniform(0.1, 0.3)
-        chirp_freq = np.random.uniform(2000, 4000)
+        chirp_start = int(_RNG.uniform(0.2, duration - 0.5) * SAMPLE_RATE)
+        chirp_dur = _RNG.uniform(0.1, 0.3)
+        chirp_freq = _RNG.uniform(2000, 4000)
 
-        chirp_t = np.linspace(0, chirp_dur, int(SAMPLE_RATE * chirp_dur))
+        chirp_t = np.linspace(0, chirp_dur, int(SAMPLE_RATE * chirp_dur), dtype=DTYPE)
 
         # Frequency modulation for realistic chirp
-        freq_mod = chirp_freq + 500 * np.sin(2 * np.pi * 15 * chirp_t)
-        chirp = np.sin(2 * np.pi * np.cumsum(freq_mod) / SAMPLE_RATE)
+        # (chirp_freq + 500 * sin(2 * pi * 15t), integrated in closed form)
+        wobble = (500 / 15) * (1 - np.cos(2 * np.pi * 15 * chirp_t))
+        chirp = np.sin(2 * np.pi * chirp_freq * chirp_t + wobble)
         chirp *= np.exp(-chirp_t * 8)
 
         # Volume variation
-        vol = np.random.uniform(0.2, 0.5)
+        vol = _RNG.uniform(0.2, 0.5)
 
         if chirp_start + len(chirp) < len(audio):
             audio[chirp_start:chirp_start + len(chirp)] += chirp * vol
@@ -1253,9 +1419,9 @@ def gen_birds_ambient():
 def gen_crickets_ambient():
     """Ambient cricket chirping - nighttime atmosphere."""
     duration = 4.0
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
-    audio = np.zeros(int(SAMPLE_RATE * duration))
+    audio = np.zeros(int(SAMPLE_RATE * duration), dtype=DTYPE)
 
     # Multiple crickets at different rates
     for i in range(4):
@@ -1264,7 +1430,7 @@ def gen_crickets_ambient():
 
         # On/off pattern
         pattern = np.abs(np.sin(2 * np.pi * chirp_rate * t)) > 0.7
-        cricket = np.sin(2 * np.pi * cricket_freq * t) * pattern.astype(float)
+        cricket = sine_wave(cricket_freq, duration) * pattern.astype(DTYPE)
 
         # Add slight frequency wobble
         cricket *= 0.15 + 0.1 * np.sin(2 * np.pi * (0.3 + i * 0.1) * t)
@@ -1282,21 +1448,21 @@ def gen_crickets_ambient():
 def gen_magic_cast():
     """Spell casting sound."""
     duration = 0.5
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
-    # Rising whoosh
-    freq = 200 + 1000 * (t / duration) ** 0.5
-    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
+    # Rising whoosh: frequency 200 + 1000 * sqrt(t / duration), integrated
+    phase = 2 * np.pi * (200 * t + 1000 * (2 / 3) * t ** 1.5 / duration ** 0.5)
 
     tone = np.sin(phase) + np.sin(phase * 1.5) * 0.3
 
     # Add shimmer
     shimmer = noise(duration, 'pink')
-    shimmer = bandpass(shimmer, 2000, 6000)
+    shimmer = bandpass_causal(shimmer, 2000, 6000)
 
     env = np.sin(np.pi * t / duration) ** 0.3
 
-    audio = (tone * 0.5 + shimmer * 0.5) * env
+    audio = _mix((tone, 0.5), (shimmer, 0.5))
+    audio *= env
     audio = fade(normalize(audio, 0.8), fade_in_ms=10, fade_out_ms=80)
     save_wav(audio, "magic_cast")
 
@@ -1304,7 +1470,7 @@ def gen_magic_cast():
 def gen_magic_hit():
     """Magic projectile impact."""
     duration = 0.3
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Impact with harmonic content
     impact = fm_synthesis(300, 200, 5, duration)
@@ -1312,10 +1478,10 @@ def gen_magic_hit():
 
     # Sparkle
     sparkle = noise(duration, 'white')
-    sparkle = highpass(sparkle, 3000)
+    sparkle = highpass_causal(sparkle, 3000)
     sparkle *= np.exp(-t * 20)
 
-    audio = impact * 0.6 + sparkle * 0.4
+    audio = _mix((impact, 0.6), (sparkle, 0.4))
     audio = fade(normalize(audio, 0.8), fade_in_ms=1, fade_out_ms=50)
     save_wav(audio, "magic_hit")
 
@@ -1323,15 +1489,15 @@ def gen_magic_hit():
 def gen_teleport():
     """Teleport/warp sound."""
     duration = 0.4
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _t(duration)
 
     # Descending then ascending sweep
     mid = duration / 2
-    freq = np.where(t < mid,
-                    1000 - 800 * (t / mid),
-                    200 + 800 * ((t - mid) / mid))
-
-    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
+    # Each half is a linear sweep; the rising half continues from the phase at mid
+    phase = np.where(t < mid,
+                     _linear_chirp_phase(t, 1000, 200, mid),
+                     _linear_chirp_phase(mid, 1000, 200, mid)
+                     + _linear_chirp_phase(t - mid, 200, 1000, mid))
     tone = np.sin(phase)
 
     # Shimmer overlay
@@ -1340,7 +1506,8 @@ def gen_teleport():
 
     env = 1 - np.abs(2 * t / duration - 1)
 
-    audio = (tone * 0.6 + shimmer * 0.4) * env
+    audio = _mix((tone, 0.6), (shimmer, 0.4))
+    audio *= env
     audio = fade(normalize(audio, 0.8), fade_in_ms=5, fade_out_ms=50)
     save_wav(audio, "teleport")
 
@@ -1357,16 +1524,15 @@ def gen_level_up():
         (523.25, 0.35),  # C5 (held longer)
     ]
 
-    audio = np.array([])
-    for freq, dur in notes_data:
-        t = np.linspace(0, dur, int(SAMPLE_RATE * dur))
-        note = np.sin(2 * np.pi * freq * t)
-        note += np.sin(2 * np.pi * freq * 2 * t) * 0.3  # Octave
-        note *= np.exp(-t * 3)
-        audio = np.concatenate([audio, note])
+    note_lens = [int(SAMPLE_RATE * dur) for _, dur in notes_data]
+    offsets = np.cumsum([0] + note_lens)
+    audio = np.empty(offsets[-1], dtype=DTYPE)
+    for i, (freq, dur) in enumerate(notes_data):
+        partials = [(freq, 3, 1.0), (freq * 2, 3, 0.3)]  # With octave
+        audio[offsets[i]:offsets[i + 1]] = _damped_sines(_t(dur), partials)
 
     # Add sparkle overlay
-    full_t = np.linspace(0, duration, len(audio))
+    full_t = _t(duration)[:len(audio)]
     sparkle = noise(len(audio) / SAMPLE_RATE, 'white')
     sparkle = highpass(sparkle[:len(audio)], 4000)
     sparkle *= np.exp(-full_t * 3) * 0.3
@@ -1380,15 +1546,22 @@ def gen_level_up():
 # NOTIFICATION SOUNDS
 # =============================================================================
 
+@nb.njit(cache=True, fastmath=True)
+def _notification(n):
+    out = np.empty(n, dtype=DTYPE)
+    for i in range(n):
+        tt = i / SAMPLE_RATE
+        tone = 0.6 * math.sin(2 * math.pi * 880 * tt) + 0.4 * math.sin(2 * math.pi * 1320 * tt)
+        out[i] = tone * math.exp(-tt * 8)
+    return out
+
+
 def gen_notification():
     """General notification ping."""
     duration = 0.3
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
 
     # Pleasant two-tone
-    tone = sine_wave(880, duration) * 0.6
-    tone += sine_wave(1320, duration) * 0.4
-    tone *= np.exp(-t * 8)
+    tone = _notification(int(SAMPLE_RATE * duration))
 
     audio = fade(normalize(tone, 0.6), fade_in_ms=5, fade_out_ms=50)
     save_wav(audio, "notification")
@@ -1399,33 +1572,37 @@ def gen_quest_complete():
     duration = 0.6
 
     notes = [392, 440, 523, 659]  # G A C E
-    audio = np.array([])
+    t = _t(0.12)
+    note_len = len(t)
 
-    for freq in notes:
-        t = np.linspace(0, 0.12, int(SAMPLE_RATE * 0.12))
-        note = np.sin(2 * np.pi * freq * t)
-        note *= np.exp(-t * 8)
-        audio = np.concatenate([audio, note])
+    # Notes followed by silence for the reverb tail
+    audio = np.zeros(len(notes) * note_len + int(0.2 * SAMPLE_RATE), dtype=DTYPE)
+    for i, freq in enumerate(notes):
+        audio[i * note_len:(i + 1) * note_len] = _damped_sine(t, freq, 8)
 
-    # Pad and add reverb
-    audio = np.pad(audio, (0, int(0.2 * SAMPLE_RATE)))
     audio = reverb_simple(audio, decay=0.2, delay_ms=40)
 
     audio = fade(normalize(audio, 0.7), fade_in_ms=5, fade_out_ms=80)
     save_wav(audio, "quest_complete")
 
 
+@nb.njit(cache=True, fastmath=True)
+def _warning(n):
+    out = np.empty(n, dtype=DTYPE)
+    for i in range(n):
+        tt = i / SAMPLE_RATE
+        pulse = math.sin(2 * math.pi * 8 * tt) * 0.3 + 0.7
+        tone = math.sin(2 * math.pi * 600 * tt) + 0.5 * math.sin(2 * math.pi * 800 * tt)
+        out[i] = tone * pulse * math.exp(-tt * 3)
+    return out
+
+
 def gen_warning():
     """Warning/alert sound."""
     duration = 0.4
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
 
     # Urgent pulsing tone
-    pulse = np.sin(2 * np.pi * 8 * t) * 0.3 + 0.7
-    tone = sine_wave(600, duration) * pulse
-    tone += sine_wave(800, duration) * pulse * 0.5
-
-    tone *= np.exp(-t * 3)
+    tone = _warning(int(SAMPLE_RATE * duration))
 
     audio = fade(normalize(tone, 0.7), fade_in_ms=5, fade_out_ms=50)
     save_wav(audio, "warning")
@@ -1435,8 +1612,8 @@ def gen_warning():
 # MAIN
 # =============================================================================
 
-# All sound generators
-SOUND_GENERATORS = {
+# All sound generators (read-only; built once at import)
+SOUND_GENERATORS = types.MappingProxyType({
     # Combat
     'sword_hit': gen_sword_hit,
     'sword_swing': gen_sword_swing,
@@ -1505,42 +1682,114 @@ SOUND_GENERATORS = {
     'notification': gen_notification,
     'quest_complete': gen_quest_complete,
     'warning': gen_warning,
-}
+})
+
+# Sounds shown by --list, by category
+_CATEGORIES = (
+    ("Combat", ('sword_hit', 'sword_swing', 'parry', 'player_hurt', 'enemy_hurt', 'enemy_death', 'critical_hit')),
+    ("Movement", ('footstep_dirt', 'footstep_stone', 'footstep_wood', 'jump', 'land', 'dodge')),
+    ("UI", ('ui_click', 'ui_hover', 'ui_confirm', 'ui_cancel', 'ui_error', 'menu_open', 'menu_close')),
+    ("Items", ('item_pickup', 'coin_pickup', 'health_pickup', 'powerup')),
+    ("Environment", ('door_open', 'door_close', 'chest_open', 'water_splash', 'fire_crackle')),
+    ("Magic", ('magic_cast', 'magic_hit', 'teleport', 'level_up')),
+    ("Notifications", ('notification', 'quest_complete', 'warning')),
+)
+
+
+@functools.cache
+def _source_key():
+    """Hash this whole module's source with the sample rate and DTYPE.
+
+    Any edit to the script invalidates every cached sound; a full rebuild is
+    cheap, and nothing a generator depends on can be left out of the key.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(inspect.getsource(sys.modules[__name__]).encode())
+    h.update(str(SAMPLE_RATE).encode())
+    h.update(np.dtype(DTYPE).str.encode())
+    return h.hexdigest()
+
+
+def _run_one(sound_name, force=False):
+    """Generate a single sound by name, skipping it if its source is unchanged."""
+    fn = SOUND_GENERATORS[sound_name]
+    key = _source_key()
+    key_file = OUTPUT_DIR / ".cache" / f"{sound_name}.key"
+    wav_file = OUTPUT_DIR / f"{sound_name}.wav"
+    if not force and wav_file.exists() and key_file.exists() and key_file.read_text() == key:
+        print(f"  Up to date: {wav_file}")
+        return
+
+    # Seed from the name so noise-based sounds are reproducible too
+    global _RNG
+    _RNG = np.random.default_rng(zlib.crc32(sound_name.encode()))
+    pending = len(_FUTURES)
+    fn()
+
+    # Record the key once this sound's writes land. The IO queue is FIFO, so
+    # those writes have already started by the time this task runs.
+    key_file.parent.mkdir(parents=True, exist_ok=True)
+    _FUTURES.append(_IO_POOL.submit(_write_key, _FUTURES[pending:], key_file, key))
+
+
+def _write_key(writes, key_file, key):
+    for write in writes:
+        write.result()
+    key_file.write_text(key)
+
+
+def _run_pooled(sound_name, force=False):
+    """Pool worker entry point; the worker may exit once this returns."""
+    _run_one(sound_name, force)
+    _drain_writes()
+
+
+def _warm_kernels():
+    """Compile (or load from cache) the numba kernels before any sound needs them."""
+    _comb(np.zeros(2, dtype=DTYPE), 1, 0.5)
+    _pink_kellet(2, 0)
+    _scatter_add(np.zeros(2, dtype=DTYPE), np.zeros(1, np.int64), np.zeros((1, 1), dtype=DTYPE),
+                 np.ones(1, np.int64))
+    for kernel in (_ui_click, _ui_hover, _coin_pickup, _notification, _warning):
+        kernel(2)
+    _two_note(1, 1, 1, 1)
 
 
 def main():
     parser = argparse.ArgumentParser(description='Generate procedural sound effects')
     parser.add_argument('sounds', nargs='*', help='Specific sounds to generate')
     parser.add_argument('--list', action='store_true', help='List available sounds')
+    parser.add_argument('--force', action='store_true', help='Regenerate even if up to date')
     args = parser.parse_args()
 
     if args.list:
         print("Available sounds:")
-        for category, sounds in [
-            ("Combat", ['sword_hit', 'sword_swing', 'parry', 'player_hurt', 'enemy_hurt', 'enemy_death', 'critical_hit']),
-            ("Movement", ['footstep_dirt', 'footstep_stone', 'footstep_wood', 'jump', 'land', 'dodge']),
-            ("UI", ['ui_click', 'ui_hover', 'ui_confirm', 'ui_cancel', 'ui_error', 'menu_open', 'menu_close']),
-            ("Items", ['item_pickup', 'coin_pickup', 'health_pickup', 'powerup']),
-            ("Environment", ['door_open', 'door_close', 'chest_open', 'water_splash', 'fire_crackle']),
-            ("Magic", ['magic_cast', 'magic_hit', 'teleport', 'level_up']),
-            ("Notifications", ['notification', 'quest_complete', 'warning']),
-        ]:
+        for category, sounds in _CATEGORIES:
             print(f"\n  {category}:")
             for s in sounds:
                 print(f"    - {s}")
         return
 
-    sounds_to_generate = args.sounds if args.sounds else SOUND_GENERATORS.keys()
-
     print(f"Generating sound effects to {OUTPUT_DIR}")
     print("=" * 50)
 
-    for sound_name in sounds_to_generate:
-        if sound_name in SOUND_GENERATORS:
-            SOUND_GENERATORS[sound_name]()
-        else:
-            print(f"  Unknown sound: {sound_name}")
-
+    # Warm up once here so pool workers inherit the compiled kernels
+    _warm_kernels()
+
+    if args.sounds:
+        for sound_name in args.sounds:
+            if sound_name in SOUND_GENERATORS:
+                _run_one(sound_name, args.force)
+            else:
+                print(f"  Unknown sound: {sound_name}")
+    else:
+        # Every generator writes its own file, so the full set runs in parallel.
+        # Import scipy.signal first so forked workers don't each pay for it.
+        _sig()
+        with multiprocessing.Pool() as pool:
+            pool.map(functools.partial(_run_pooled, force=args.force), SOUND_GENERATORS)
+
+    _drain_writes()
     print("=" * 50)
     print("Done!")
 
@@ -1,152 +1,242 @@
 #!/usr/bin/env python3
 """Generate cooking sound effects for the cooking station."""
 
+import functools
+import numexpr as ne
 import numpy as np
 import soundfile as sf
 from scipy import signal
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sfx_kernels import add_bursts, sosfilt_nb
 
 # Output directory
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'audio', 'generated')
 SAMPLE_RATE = 44100
+DTYPE = np.float32  # Working precision; output is 16-bit PCM anyway
+
+# Filter designs depend only on constants, so build them once at import
+_NYQ = SAMPLE_RATE / 2
+_SIZZLE_SOS = signal.butter(4, [2000 / _NYQ, 8000 / _NYQ], btype='band', output='sos').astype(DTYPE)
+_BURN_SOS = signal.butter(3, [500 / _NYQ, 3000 / _NYQ], btype='band', output='sos').astype(DTYPE)
+
+# One full turn of a 32-bit phase accumulator, in radians per step
+_PHASE_TO_RAD = DTYPE(2 * np.pi / 2**32)
+
+def sine(freq, samples, out=None):
+    """sin(2*pi*freq*n / SAMPLE_RATE) for n in range(samples), as DTYPE.
+
+    The phase is a wrapping 32-bit integer accumulator (as in a DDS
+    oscillator), so it stays exact however long the tone runs, and the sine
+    itself is evaluated on a small, float32-safe argument. Pass out to
+    reuse a buffer.
+    """
+    step = np.uint32(round(freq / SAMPLE_RATE * 2**32) % 2**32)
+    phase = (np.arange(samples, dtype=np.uint32) * step).view(np.int32)
+    if out is None:
+        out = np.empty(samples, dtype=DTYPE)
+    np.multiply(phase, _PHASE_TO_RAD, out=out)
+    return np.sin(out, out=out)
+
+@functools.lru_cache(maxsize=32)
+def _tspace(duration):
+    """Read-only time base of int(duration * SAMPLE_RATE) samples, shared between calls."""
+    t = np.linspace(0, duration, int(duration * SAMPLE_RATE), dtype=DTYPE)
+    t.setflags(write=False)
+    return t
+
+@functools.lru_cache(maxsize=32)
+def _ramp(start, stop, samples):
+    """Read-only linear fade from start to stop, shared between calls."""
+    ramp = np.linspace(start, stop, samples, dtype=DTYPE)
+    ramp.setflags(write=False)
+    return ramp
+
+@functools.lru_cache(maxsize=32)
+def _decay(rate, duration):
+    """Read-only exp(-rate * t) over _tspace(duration), shared between calls."""
+    env = np.exp(-rate * _tspace(duration))
+    env.setflags(write=False)
+    return env
+
+def normalize(audio, peak):
+    """Scale audio in place so its largest magnitude is peak."""
+    max_val = max(audio.max(), -audio.min())  # Two reductions, no |audio| temporary
+    if max_val > 0:
+        np.multiply(audio, DTYPE(peak / max_val), out=audio)
+    return audio
+
+class CookingSoundBank:
+    """Renders the cooking sounds into one set of reusable buffers.
+
+    Each method returns a view of the bank's output buffer that stays valid
+    until the next call on the same bank, so copy it to keep it. A bank is
+    not thread-safe: give each thread its own. Time bases and envelopes come
+    from the read-only module caches, which every bank shares.
+    """
+
+    def __init__(self, max_duration=3.0, rng=None):
+        samples = int(max_duration * SAMPLE_RATE)
+        self._out = np.empty(samples, dtype=DTYPE)
+        self._scratch = np.empty((2, samples), dtype=DTYPE)
+        self._rng = np.random.default_rng() if rng is None else rng
+
+    def _output(self, samples):
+        if samples > len(self._out):
+            raise ValueError(f"{samples} samples exceed this bank's {len(self._out)}-sample buffers")
+        return self._out[:samples]
+
+    def sizzle(self, duration=3.0):
+        """Generate a sizzling/frying sound effect."""
+        samples = int(duration * SAMPLE_RATE)
+        t = _tspace(duration)
+
+        # Base noise
+        sizzle = self._rng.standard_normal(samples, dtype=DTYPE, out=self._output(samples))
+
+        # Bandpass filter to get sizzle frequencies (2kHz - 8kHz)
+        sosfilt_nb(_SIZZLE_SOS, sizzle, sizzle)
+
+        # Add some crackle pops
+        num_pops = int(duration * 15)  # 15 pops per second
+        pop_pos = self._rng.integers(0, samples - 500, num_pops)
+        pop_length = self._rng.integers(50, 200, num_pops)
+        pop_amp = self._rng.uniform(0.3, 0.8, num_pops)
+        add_bursts(sizzle, pop_pos, pop_length, pop_amp, 5, self._rng)
+
+        # Add amplitude modulation for bubbling effect
+        bubble_freq = self._rng.uniform(3, 8)
+        # 0.7 + 0.3 * sin(...), fused into one pass; integer literals keep it float32
+        ne.evaluate("sizzle * (7 + 3 * sin(w * t)) / 10",
+                    local_dict={'sizzle': sizzle, 't': t, 'w': DTYPE(2 * np.pi * bubble_freq)},
+                    out=sizzle)
+
+        # Fade in/out for looping
+        fade_samples = int(0.1 * SAMPLE_RATE)
+        sizzle[:fade_samples] *= _ramp(0, 1, fade_samples)
+        sizzle[-fade_samples:] *= _ramp(1, 0, fade_samples)
+
+        # Normalize
+        normalize(sizzle, 0.7)
+
+        return sizzle
+
+    def cooking_complete(self):
+        """Generate a pleasant completion chime sound."""
+        duration = 0.8
+        samples = int(duration * SAMPLE_RATE)
+
+        # Two-tone chime (like a success sound)
+        freq1 = 880  # A5
+        freq2 = 1320  # E6
+
+        # First tone
+        tone1_env = _decay(4, duration)
+
+        # Second tone (slightly delayed); only its tail is ever non-silent
+        delay_samples = int(0.15 * SAMPLE_RATE)
+        tone2_env = _decay(3, duration)[:samples - delay_samples]
+
+        # Each tone plus its octave harmonic for richness, accumulated in place
+        chime = self._output(samples)
+        chime[:] = 0
+        tone_buf, harmonic_buf = self._scratch
+        for freq, env, start in ((freq1, tone1_env, 0), (freq2, tone2_env, delay_samples)):
+            length = samples - start
+            tone = sine(freq, length, out=tone_buf[:length])
+            harmonic = sine(freq * 2, length, out=harmonic_buf[:length])
+            harmonic *= 0.3
+            tone += harmonic
+            tone *= env
+            chime[start:] += tone
+
+        # Normalize
+        normalize(chime, 0.8)
+
+        return chime
+
+    def burn_sound(self):
+        """Generate a burning/hissing sound with a darker tone."""
+        duration = 1.2
+        samples = int(duration * SAMPLE_RATE)
+        t = _tspace(duration)
+
+        # Deep crackling noise
+        burn = self._rng.standard_normal(samples, dtype=DTYPE, out=self._output(samples))
+
+        # Lower frequency bandpass for darker sound (500Hz - 3kHz)
+        sosfilt_nb(_BURN_SOS, burn, burn)
+
+        # Add a descending tone for "uh oh" feeling
+        # Frequency falls as 400 * exp(-2t)
+        descend_tone = np.multiply(_decay(2, duration), t, out=self._scratch[0, :samples])
+        descend_tone *= 2 * np.pi * 400
+        np.sin(descend_tone, out=descend_tone)
+        descend_tone *= _decay(1.5, duration)
+        descend_tone *= 0.4
+
+        # Intense crackle bursts
+        num_crackles = 8
+        pos = samples * np.arange(num_crackles) // num_crackles
+        pos = np.clip(pos + self._rng.integers(-1000, 1000, num_crackles), 0, samples - 1000)
+        crackle_len = self._rng.integers(200, 600, num_crackles)
+        crackle_amp = self._rng.uniform(0.5, 1.0, num_crackles)
+        add_bursts(burn, pos, crackle_len, crackle_amp, 8, self._rng)
+
+        burn += descend_tone
+
+        # Envelope: quick attack, sustained, then fade (only the ramps need work)
+        attack = int(0.05 * SAMPLE_RATE)
+        release = int(0.3 * SAMPLE_RATE)
+        burn[:attack] *= _ramp(0, 1, attack)
+        burn[-release:] *= _ramp(1, 0, release)
+
+        # Normalize
+        normalize(burn, 0.75)
+
+        return burn
 
 def generate_sizzle(duration=3.0):
-    """Generate a sizzling/frying sound effect."""
-    samples = int(duration * SAMPLE_RATE)
-    t = np.linspace(0, duration, samples)
-
-    # Base noise
-    noise = np.random.randn(samples)
-
-    # Bandpass filter to get sizzle frequencies (2kHz - 8kHz)
-    nyq = SAMPLE_RATE / 2
-    low = 2000 / nyq
-    high = 8000 / nyq
-    b, a = signal.butter(4, [low, high], btype='band')
-    sizzle = signal.filtfilt(b, a, noise)
-
-    # Add some crackle pops
-    num_pops = int(duration * 15)  # 15 pops per second
-    for _ in range(num_pops):
-        pop_pos = np.random.randint(0, samples - 500)
-        pop_length = np.random.randint(50, 200)
-        pop_amp = np.random.uniform(0.3, 0.8)
-        decay = np.exp(-np.linspace(0, 5, pop_length))
-        pop = np.random.randn(pop_length) * decay * pop_amp
-        sizzle[pop_pos:pop_pos + pop_length] += pop
-
-    # Add amplitude modulation for bubbling effect
-    bubble_freq = np.random.uniform(3, 8)
-    modulation = 0.7 + 0.3 * np.sin(2 * np.pi * bubble_freq * t)
-    sizzle *= modulation
-
-    # Fade in/out for looping
-    fade_samples = int(0.1 * SAMPLE_RATE)
-    fade_in = np.linspace(0, 1, fade_samples)
-    fade_out = np.linspace(1, 0, fade_samples)
-    sizzle[:fade_samples] *= fade_in
-    sizzle[-fade_samples:] *= fade_out
-
-    # Normalize
-    sizzle = sizzle / np.max(np.abs(sizzle)) * 0.7
-
-    return sizzle.astype(np.float32)
+    """Generate a sizzling/frying sound effect into a fresh array."""
+    return CookingSoundBank(duration).sizzle(duration)
 
 def generate_cooking_complete():
-    """Generate a pleasant completion chime sound."""
-    duration = 0.8
-    samples = int(duration * SAMPLE_RATE)
-    t = np.linspace(0, duration, samples)
-
-    # Two-tone chime (like a success sound)
-    freq1 = 880  # A5
-    freq2 = 1320  # E6
-
-    # First tone
-    tone1_env = np.exp(-t * 4)
-    tone1 = np.sin(2 * np.pi * freq1 * t) * tone1_env
-
-    # Second tone (slightly delayed)
-    delay_samples = int(0.15 * SAMPLE_RATE)
-    tone2_t = np.maximum(t - 0.15, 0)
-    tone2_env = np.exp(-tone2_t * 3)
-    tone2_env[:delay_samples] = 0
-    tone2 = np.sin(2 * np.pi * freq2 * t) * tone2_env
-
-    # Add harmonics for richness
-    harmonics1 = np.sin(2 * np.pi * freq1 * 2 * t) * tone1_env * 0.3
-    harmonics2 = np.sin(2 * np.pi * freq2 * 2 * t) * tone2_env * 0.3
-
-    chime = tone1 + tone2 + harmonics1 + harmonics2
-
-    # Normalize
-    chime = chime / np.max(np.abs(chime)) * 0.8
-
-    return chime.astype(np.float32)
+    """Generate a pleasant completion chime sound into a fresh array."""
+    return CookingSoundBank(0.8).cooking_complete()
 
 def generate_burn_sound():
-    """Generate a burning/hissing sound with a darker tone."""
-    duration = 1.2
-    samples = int(duration * SAMPLE_RATE)
-    t = np.linspace(0, duration, samples)
-
-    # Deep crackling noise
-    noise = np.random.randn(samples)
-
-    # Lower frequency bandpass for darker sound
-    nyq = SAMPLE_RATE / 2
-    low = 500 / nyq
-    high = 3000 / nyq
-    b, a = signal.butter(3, [low, high], btype='band')
-    burn = signal.filtfilt(b, a, noise)
-
-    # Add a descending tone for "uh oh" feeling
-    descend_freq = 400 * np.exp(-t * 2)
-    descend_tone = np.sin(2 * np.pi * descend_freq * t) * np.exp(-t * 1.5) * 0.4
-
-    # Intense crackle bursts
-    num_crackles = 8
-    for i in range(num_crackles):
-        pos = int(samples * (i / num_crackles) + np.random.randint(-1000, 1000))
-        pos = max(0, min(pos, samples - 1000))
-        crackle_len = np.random.randint(200, 600)
-        crackle_amp = np.random.uniform(0.5, 1.0)
-        decay = np.exp(-np.linspace(0, 8, crackle_len))
-        crackle = np.random.randn(crackle_len) * decay * crackle_amp
-        burn[pos:pos + crackle_len] += crackle
-
-    burn = burn + descend_tone
-
-    # Envelope: quick attack, sustained, then fade
-    envelope = np.ones(samples)
-    attack = int(0.05 * SAMPLE_RATE)
-    release = int(0.3 * SAMPLE_RATE)
-    envelope[:attack] = np.linspace(0, 1, attack)
-    envelope[-release:] = np.linspace(1, 0, release)
-    burn *= envelope
-
-    # Normalize
-    burn = burn / np.max(np.abs(burn)) * 0.75
-
-    return burn.astype(np.float32)
+    """Generate a burning/hissing sound with a darker tone into a fresh array."""
+    return CookingSoundBank(1.2).burn_sound()
+
+# (description, output file, CookingSoundBank method) for every sound this script renders
+SOUNDS = (
+    ('cooking sizzle', 'cooking_sizzle.wav', functools.partial(CookingSoundBank.sizzle, duration=3.0)),
+    ('cooking complete', 'cooking_complete.wav', CookingSoundBank.cooking_complete),
+    ('burn', 'cooking_burn.wav', CookingSoundBank.burn_sound),
+)
+
+_THREAD_BANKS = threading.local()
+
+def _render(job):
+    """Generate one sound and write it out; runs on a worker thread."""
+    _, filename, generate = job
+    bank = getattr(_THREAD_BANKS, 'bank', None)
+    if bank is None:
+        bank = _THREAD_BANKS.bank = CookingSoundBank()
+    audio = generate(bank)
+    sf.write(os.path.join(OUTPUT_DIR, filename), audio, SAMPLE_RATE)
+    return f"  Saved: {filename} ({len(audio)/SAMPLE_RATE:.1f}s)"
 
 def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    print("Generating cooking sizzle sound...")
-    sizzle = generate_sizzle(3.0)
-    sf.write(os.path.join(OUTPUT_DIR, 'cooking_sizzle.wav'), sizzle, SAMPLE_RATE)
-    print(f"  Saved: cooking_sizzle.wav ({len(sizzle)/SAMPLE_RATE:.1f}s)")
-
-    print("Generating cooking complete sound...")
-    complete = generate_cooking_complete()
-    sf.write(os.path.join(OUTPUT_DIR, 'cooking_complete.wav'), complete, SAMPLE_RATE)
-    print(f"  Saved: cooking_complete.wav ({len(complete)/SAMPLE_RATE:.1f}s)")
-
-    print("Generating burn sound...")
-    burn = generate_burn_sound()
-    sf.write(os.path.join(OUTPUT_DIR, 'cooking_burn.wav'), burn, SAMPLE_RATE)
-    print(f"  Saved: cooking_burn.wav ({len(burn)/SAMPLE_RATE:.1f}s)")
+    # Each sound is independent, so render them all at once
+    with ThreadPoolExecutor() as pool:
+        for (description, _, _), saved in zip(SOUNDS, pool.map(_render, SOUNDS)):
+            print(f"Generating {description} sound...")
+            print(saved)
 
     print("\nAll cooking sounds generated!")
 
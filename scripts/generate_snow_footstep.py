@@ -1,14 +1,67 @@
 #!/usr/bin/env python3
 """Generate snow footstep sound effect."""
 
+import functools
+import numba as nb
 import numpy as np
 import soundfile as sf
 from scipy import signal
 import os
 
+from sfx_kernels import add_bursts, sosfilt_nb
+
 # Output directory
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'audio', 'generated')
 SAMPLE_RATE = 44100
+DTYPE = np.float32  # Working precision; output is 16-bit PCM anyway
+_RNG = np.random.default_rng()
+
+# Filter designs depend only on constants, so build them once at import
+_NYQ = SAMPLE_RATE / 2
+_CRUNCH_SOS = signal.butter(3, [500 / _NYQ, 4000 / _NYQ], btype='band', output='sos').astype(DTYPE)
+_CRUNCH_SOS[0, :3] *= 0.0059  # Brings pink_voss down to the crunch level of FFT-shaped pink noise
+_CRYSTAL_SOS = signal.butter(2, [6000 / _NYQ, 12000 / _NYQ], btype='band', output='sos').astype(DTYPE)
+_CRYSTAL_SOS[0, :3] *= 0.15  # Crystal layer level, folded into the filter gain
+
+@nb.njit(cache=True, fastmath=True)
+def pink_voss(draws, out):
+    """Voss-McCartney pink noise into out (compiled).
+
+    The first len(draws) - len(out) draws seed the octave rows; each sample
+    then redraws one row (row k every 2**(k+1) samples) and outputs their sum.
+    """
+    rows = draws.shape[0] - out.shape[0]
+    state = draws[:rows].copy()
+    total = 0.0
+    for k in range(rows):
+        total += state[k]
+    for i in range(out.shape[0]):
+        counter = i + 1
+        row = 0
+        while counter & 1 == 0 and row < rows - 1:
+            counter >>= 1
+            row += 1
+        new = draws[rows + i]
+        total += new - state[row]
+        state[row] = new
+        out[i] = total
+    return out
+
+@functools.lru_cache(maxsize=32)
+def footstep_envelope(samples, attack_samples):
+    """Square-root attack then exponential decay, built once per length and read-only."""
+    envelope = np.empty(samples, dtype=DTYPE)
+    envelope[:attack_samples] = np.sqrt(np.linspace(0, 1, attack_samples, dtype=DTYPE))
+    envelope[attack_samples:] = np.exp(np.linspace(0, -3, samples - attack_samples, dtype=DTYPE))
+    envelope.setflags(write=False)
+    return envelope
+
+def normalize(audio, peak):
+    """Scale audio in place so its largest magnitude is peak."""
+    max_val = max(audio.max(), -audio.min())  # Two reductions, no |audio| temporary
+    if max_val > 0:
+        np.multiply(audio, DTYPE(peak / max_val), out=audio)
+    return audio
 
 def generate_snow_footstep(duration=0.25):
     """Generate a crunchy snow footstep sound.
@@ -17,67 +70,44 @@ def generate_snow_footstep(duration=0.25):
     from ice crystals compressing.
     """
     samples = int(duration * SAMPLE_RATE)
-    t = np.linspace(0, duration, samples)
 
     # Base noise - pink noise for snow
-    noise = np.random.randn(samples)
+    noise = _RNG.standard_normal(samples, dtype=DTYPE)
 
-    # Pink noise filter (1/f spectrum) - softer than white noise
-    # Create simple 1/f filter
-    freqs = np.fft.rfftfreq(samples, 1/SAMPLE_RATE)
-    freqs[0] = 1  # Avoid division by zero
-    pink_filter = 1 / np.sqrt(freqs)
-    pink_filter[0] = 0  # DC component
-
-    noise_fft = np.fft.rfft(noise)
-    pink_noise = np.fft.irfft(noise_fft * pink_filter, samples)
+    # Pink noise (1/f spectrum) - softer than white noise; 16 octave rows
+    # reach well below the lowest audible band
+    pink_noise = pink_voss(_RNG.standard_normal(samples + 16, dtype=DTYPE),
+                           np.empty(samples, dtype=DTYPE))
 
     # Bandpass to get snowy crunch (500Hz - 4kHz)
-    nyq = SAMPLE_RATE / 2
-    low = 500 / nyq
-    high = 4000 / nyq
-    b, a = signal.butter(3, [low, high], btype='band')
-    crunch = signal.filtfilt(b, a, pink_noise)
+    crunch = sosfilt_nb(_CRUNCH_SOS, pink_noise, pink_noise)
 
-    # Add high-frequency crystal sounds (8kHz - 12kHz)
-    high_low = 6000 / nyq
-    high_high = 12000 / nyq
-    b2, a2 = signal.butter(2, [high_low, high_high], btype='band')
-    crystals = signal.filtfilt(b2, a2, noise) * 0.15
+    # Add high-frequency crystal sounds (6kHz - 12kHz); the white noise is
+    # no longer needed, so filter it in place
+    crystals = sosfilt_nb(_CRYSTAL_SOS, noise, noise)
 
-    # Combine
-    sound = crunch + crystals
+    # Combine, accumulating everything from here on into the crunch buffer
+    sound = crunch
+    sound += crystals
 
     # Add some micro-crunches (small amplitude variations)
     num_crunches = int(duration * 40)  # 40 per second
-    for _ in range(num_crunches):
-        crunch_pos = np.random.randint(0, max(1, samples - 200))
-        crunch_length = np.random.randint(30, 100)
-        crunch_amp = np.random.uniform(0.1, 0.4)
-        decay = np.exp(-np.linspace(0, 4, crunch_length))
-        micro_crunch = np.random.randn(crunch_length) * decay * crunch_amp
-        end_pos = min(crunch_pos + crunch_length, samples)
-        actual_length = end_pos - crunch_pos
-        sound[crunch_pos:end_pos] += micro_crunch[:actual_length]
+    if num_crunches:
+        crunch_pos = _RNG.integers(0, max(1, samples - 200), num_crunches)
+        crunch_length = _RNG.integers(30, 100, num_crunches)
+        crunch_amp = _RNG.uniform(0.1, 0.4, num_crunches)
+        add_bursts(sound, crunch_pos, crunch_length, crunch_amp, 4, _RNG)
 
     # Envelope - quick attack, medium decay (foot pressing into snow)
     attack_time = 0.02
-    decay_time = duration - attack_time
     attack_samples = int(attack_time * SAMPLE_RATE)
-    decay_samples = samples - attack_samples
-
-    envelope = np.ones(samples)
-    envelope[:attack_samples] = np.linspace(0, 1, attack_samples) ** 0.5  # Quick attack
-    envelope[attack_samples:] = np.exp(-np.linspace(0, 3, decay_samples))  # Exponential decay
 
-    sound *= envelope
+    sound *= footstep_envelope(samples, attack_samples)
 
     # Normalize
-    max_val = np.max(np.abs(sound))
-    if max_val > 0:
-        sound = sound / max_val * 0.7
+    normalize(sound, 0.7)
 
-    return sound.astype(np.float32)
+    return sound
 
 def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
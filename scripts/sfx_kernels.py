@@ -0,0 +1,44 @@
+"""Compiled DSP kernels shared by the standalone sound generation scripts."""
+
+import math
+import numba as nb
+import numpy as np
+
+@nb.njit(cache=True, fastmath=True, nogil=True)
+def sosfilt_nb(sos, x, out):
+    """Run x through the biquad cascade sos into out in one pass (compiled).
+
+    Each section is transposed direct form II with a0 == 1, as signal.butter
+    produces; out may be x itself.
+    """
+    n_sections = sos.shape[0]
+    z1 = np.zeros(n_sections, dtype=sos.dtype)
+    z2 = np.zeros(n_sections, dtype=sos.dtype)
+    for n in range(x.shape[0]):
+        y = x[n]
+        for s in range(n_sections):
+            xs = y
+            y = sos[s, 0] * xs + z1[s]
+            z1[s] = sos[s, 1] * xs - sos[s, 4] * y + z2[s]
+            z2[s] = sos[s, 2] * xs - sos[s, 5] * y
+        out[n] = y
+    return out
+
+@nb.njit(cache=True, fastmath=True, nogil=True)
+def _scatter_bursts(dst, positions, lengths, amps, noise, decay_end):
+    """Add each noise row, shaped by its decay and amplitude, into dst (compiled)."""
+    for k in range(positions.shape[0]):
+        start = positions[k]
+        length = min(lengths[k], dst.shape[0] - start)
+        rate = decay_end / (lengths[k] - 1)
+        for i in range(length):
+            dst[start + i] += noise[k, i] * math.exp(-rate * i) * amps[k]
+
+def add_bursts(audio, positions, lengths, amps, decay_end, rng):
+    """Add decaying noise bursts drawn from rng to audio in place, all at once.
+
+    Burst i starts at positions[i], lasts lengths[i] samples (clipped at the
+    end of audio) and decays exponentially from amps[i] to exp(-decay_end) of that.
+    """
+    noise = rng.standard_normal((len(lengths), lengths.max()), dtype=audio.dtype)
+    _scatter_bursts(audio, positions, lengths, amps, noise, decay_end)